@@ -471,6 +471,12 @@ func (p *Planner) RunRequest(
 	ctx context.Context,
 	req *request.Request,
 ) (result []map[string]any, err error) {
+	if len(req.Mutations) > 0 &&
+		len(req.Mutations[0].Selections) > 1 &&
+		!req.Mutations[0].Directives.ExplainType.HasValue() {
+		return p.runMutationSelections(ctx, req.Mutations[0])
+	}
+
 	planNode, err := p.makePlan(req)
 	if err != nil {
 		return nil, err
@@ -504,6 +510,54 @@ func (p *Planner) RunRequest(
 	return p.executeRequest(ctx, planNode)
 }
 
+// runMutationSelections plans and executes each selection of the given mutation
+// operation in turn, returning their results concatenated in request order.
+//
+// This allows several (aliased) mutations to be batched within a single request
+// and transaction.
+func (p *Planner) runMutationSelections(
+	ctx context.Context,
+	def *request.OperationDefinition,
+) ([]map[string]any, error) {
+	docs := []map[string]any{}
+	for _, selection := range def.Selections {
+		if selection == nil {
+			continue
+		}
+
+		results, err := p.runSelection(ctx, selection)
+		if err != nil {
+			return nil, err
+		}
+		docs = append(docs, results...)
+	}
+	return docs, nil
+}
+
+// runSelection plans and executes a single top-level selection.
+func (p *Planner) runSelection(
+	ctx context.Context,
+	selection request.Selection,
+) (result []map[string]any, err error) {
+	planNode, err := p.makePlan(selection)
+	if err != nil {
+		return nil, err
+	}
+
+	defer func() {
+		if e := planNode.Close(); e != nil {
+			err = NewErrFailedToClosePlan(e, "running request")
+		}
+	}()
+
+	err = planNode.Init()
+	if err != nil {
+		return nil, err
+	}
+
+	return p.executeRequest(ctx, planNode)
+}
+
 // RunSubscriptionRequest plans a request specific to a subscription and returns the result.
 func (p *Planner) RunSubscriptionRequest(
 	ctx context.Context,
@@ -1,7 +1,15 @@
-import defradb
 from defradb import DefraConfig, DefraClient
+from graphql import DocumentNode, print_ast
+import aiohttp
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import numpy as np
+import orjson
 import random
-from datetime import datetime, timedelta
+import requests
+from requests.adapters import HTTPAdapter
+import time
 
 schema = """
 type Project {
@@ -116,22 +124,110 @@ type Badge {
 }
 """
 
+# The type recording the sha256 of the loaded schema. It is loaded apart from
+# the schema, so that nodes already holding the schema's types can still get it.
+schema_version_schema = """
+type SchemaVersion {
+    hash: String
+}
+"""
+
 # Create the defradb configuration.
 config = DefraConfig(
     api_url="localhost:9181/api/v0/",
     tcp_multiaddr="localhost:9161",
 )
 
-# Create the defradb client.
-client = DefraClient(config)
+# The graphql endpoint of the defradb node, and the aiohttp session used to
+# send the seeding requests to it concurrently (opened by seed). The node's
+# grpc api only manages replicators and p2p collections, and its http api is
+# served over plain http/1.1, so requests are multiplexed over a pool of
+# keep-alive connections and batched into aliased mutations rather than streamed.
+graphql_url = f"{config.scheme}{config.api_url}graphql"
+session = None
+
+# The headers of the (orjson encoded) graphql requests.
+json_headers = {"Content-Type": "application/json"}
+
+class RequestError(Exception):
+  """
+  The errors returned by the defradb node for a failed graphql request
+  """
+  def __init__(self, errors):
+    super().__init__("Failed to execute request", errors)
+    self.errors = errors
+
+  def is_unknown_field(self, name):
+    """
+    Whether the request failed because the node doesn't know of the queried field
+    """
+    return any(f'Cannot query field "{name}"' in error for error in self.errors)
+
+def response_data(content):
+  """
+  Parse the response of the defradb node to a graphql request
+  content: the raw (JSON) body of the response
+  returns: the data of the response, raising if the request failed
+  """
+  response_json = orjson.loads(content)
+
+  if response_json.get("errors"):
+    raise RequestError(response_json["errors"])
+  return response_json["data"]
+
+class SessionDefraClient(DefraClient):
+  """
+  A defradb client sending its graphql requests over a single persistent
+  keep-alive session, rather than opening a new connection for each request
+  """
+  def __init__(self, cfg):
+    super().__init__(cfg)
+    self._session = requests.Session()
+    self._session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=16, pool_block=False))
+    self._session.headers["Connection"] = "keep-alive"
+    self._graphql_url = f"{cfg.scheme}{cfg.api_url}graphql"
+
+  def request(self, request: DocumentNode | str):
+    """
+    Execute a graphql request against the defradb node
+    request: the gql request, or the graphql request string
+    """
+    if isinstance(request, DocumentNode):
+      request = print_ast(request)
+    response = self._session.post(self._graphql_url, data=orjson.dumps({"query": request}), headers=json_headers)
+    return response_data(response.content)
+
+  def close(self):
+    """
+    Close the connections of the client's session
+    """
+    self._session.close()
+
+# The defradb client used to load the schema (created by main, so that
+# importing this module or forking workers doesn't hold its connection).
+client = None
+
+# The generators used to draw random fields one at a time, and in bulk.
+rand = random.Random()
+rng = np.random.default_rng()
+
+def rand_suffix():
+  """
+  Draw a random number suffixing a generated name, between 1 and 1024
+  """
+  return rand.getrandbits(10) + 1
 
-def random_datetime():
+def random_datetimes(n):
   """
-  Generate a random RFC 3339 formatted datetime
+  Generate n random RFC 3339 formatted datetimes at once
   """
-  random_seconds = random.randint(0, 10**6)
-  random_dt = datetime.utcnow() - timedelta(seconds=random_seconds)
-  return random_dt.isoformat() + "Z"
+  timestamps = int(time.time()) - rng.integers(0, 10**6, n)
+  datetimes = timestamps.astype("datetime64[s]").astype("datetime64[us]").astype(str)
+  return np.char.add(datetimes, "Z").tolist()
+
+# The prefixes of the urls of the generated evidences and user profiles.
+evidence_url = "https://example.com/evidence/"
+profile_url = "https://example.com/profile/"
 
 def rand_project():
  return {
@@ -139,178 +235,451 @@ def rand_project():
     "handle": "project-8"
   }
 
-def rand_assessment(project_key):
+def rand_assessment(project_key, date):
   return {
     "project_id": project_key,  # Assumes that you've already created the project and have its key
-    "date": random_datetime()
+    "date": date
   }
 
 def rand_latent_variable(assessment_key, domain):
   return {
     "assessment_id": assessment_key,  # Assumes that you've already created the assessment and have its key
-    "name": "Variable " + str(random.randint(1, 10000)),
+    "name": f"Variable {rand.randint(1, 10000)}",
     "domain": domain,
     "categories": ["Dead", "Alive", "Thriving"],
     "ordered_categorical": True
   }
 
-def rand_timestampvalue_real(variable_key):
-  median = random.uniform(0, 10000)
-  return {
-    "variable_id": variable_key,  # Assumes that you've already created the variable and have its key
-    "timestamp": random_datetime(),
-    "upper_ci95": median - random.uniform(0, 500),
-    "lower_ci95": median + random.uniform(0, 500),
-    "mean": median,
-    "median": median,
-    "sigmoid_negentropy": random.uniform(0, 1)
-}
+# The JSON of the timestamp values, pre-escaped for the data argument of their
+# create mutations, so that bulk generated values can be rendered directly
+# into it without building (and then serializing) a dict for each of them.
+timestampvalue_real_template = (
+  '{\\"variable_id\\": \\"%s\\", \\"timestamp\\": \\"%s\\", \\"upper_ci95\\": %r, \\"lower_ci95\\": %r, '
+  '\\"mean\\": %r, \\"median\\": %r, \\"sigmoid_negentropy\\": %r}'
+)
+timestampvalue_categorical_template = (
+  '{\\"variable_id\\": \\"%s\\", \\"timestamp\\": \\"%s\\", \\"mode\\": %d, \\"sigmoid_negentropy\\": %r}'
+)
 
-def rand_timestampvalue_categorical(variable_key):
-  return {
-    "variable_id": variable_key, # Assumes that you've already created the variable and have its key
-    "timestamp": random_datetime(),
-    "mode": random.randint(1, 3),
-    "sigmoid_negentropy": random.uniform(0, 1)
-  }
+def rand_timestampvalues_real(variable_key, n):
+  """
+  Generate n real timestamp values for the variable, drawing each of their
+  random fields for all of them at once
+  returns: the pre-rendered data of the timestamp values
+  """
+  medians = rng.uniform(0, 10000, n)
+  uppers = medians - rng.uniform(0, 500, n)
+  lowers = medians + rng.uniform(0, 500, n)
+  negentropies = rng.uniform(0, 1, n)
+  return [
+    timestampvalue_real_template % (variable_key, timestamp, upper, lower, median, median, negentropy)
+    for timestamp, median, upper, lower, negentropy in zip(
+      random_datetimes(n), medians.tolist(), uppers.tolist(), lowers.tolist(), negentropies.tolist()
+    )
+  ]
+
+def rand_timestampvalues_categorical(variable_key, n):
+  """
+  Generate n categorical timestamp values for the variable, drawing each of
+  their random fields for all of them at once
+  returns: the pre-rendered data of the timestamp values
+  """
+  modes = rng.integers(1, 3, n, endpoint=True)
+  negentropies = rng.uniform(0, 1, n)
+  return [
+    timestampvalue_categorical_template % (variable_key, timestamp, mode, negentropy)
+    for timestamp, mode, negentropy in zip(random_datetimes(n), modes.tolist(), negentropies.tolist())
+  ]
 
 def rand_observable(assessment_key, domain):
   return {
     "assessment_id": assessment_key,
     "domain": domain,
-    "name": "Observable " + str(random.randint(1, 1000)),
+    "name": f"Observable {rand_suffix()}",
   }
 
 def rand_indicator(variable_key, observable_key):
   return {
     "observable_id": observable_key,  # Assumes that you've already created the observable and have its key
     "latent_variable_id": variable_key, # Assumes that you've already created the variable and have its key
-    "correlation": random.uniform(0, 1),
-    "mutual_information": random.uniform(0, 1)
+    "correlation": rand.uniform(0, 1),
+    "mutual_information": rand.uniform(0, 1)
   }
 
-def rand_evidence(observable_key, user_key):
-  return {
-    "observable_id": observable_key, # Assumes that you've already created the observable and have its key
-    "uploaded_by_id": user_key,
-    "asset_name": "Evidence " + str(random.randint(1, 1000)),
-    "asset_url": "https://example.com/evidence/" + str(random.randint(1, 1000)),
-    "confidence": random.uniform(0, 1),
-    "uploaded": random_datetime(),
-  }
+# The pre-escaped JSON of the evidences, see timestampvalue_real_template.
+evidence_template = (
+  '{\\"observable_id\\": \\"%s\\", \\"uploaded_by_id\\": \\"%s\\", \\"asset_name\\": \\"Evidence %d\\", '
+  '\\"asset_url\\": \\"' + evidence_url + '%d\\", \\"confidence\\": %r, \\"uploaded\\": \\"%s\\"}'
+)
+
+def rand_evidences(observable_keys, user_keys):
+  """
+  Generate an evidence for each pair of observable and user keys, drawing each
+  of their random fields for all of them at once
+  returns: the pre-rendered data of the evidences
+  """
+  n = len(observable_keys)
+  suffixes = rng.integers(1, 1024, (2, n), endpoint=True)
+  confidences = rng.uniform(0, 1, n)
+  return [
+    evidence_template % (observable_key, user_key, name_suffix, url_suffix, confidence, uploaded)
+    for observable_key, user_key, name_suffix, url_suffix, confidence, uploaded in zip(
+      observable_keys, user_keys, *suffixes.tolist(), confidences.tolist(), random_datetimes(n)
+    )
+  ]
 
 def rand_user():
   return {
-    "name": "User " + str(random.randint(1, 3)),
-    "profile_url": "https://example.com/profile/" + str(random.randint(1, 1000))
+    "name": f"User {rand.randint(1, 3)}",
+    "profile_url": f"{profile_url}{rand_suffix()}"
   }
 
 def rand_method(observable_key):
   return {
     "observable_id": observable_key,
-    "name": random.choice(["satellite", "expert_attestation", "iot_sensor", "image"])
+    "name": rand.choice(["satellite", "expert_attestation", "iot_sensor", "image"])
   }
 
 def rand_badge(variable_key):
   return {
     "variable_id": variable_key, # Assumes that you've already created the variable and have its key
-    "handle": "badge-" + str(random.randint(1, 1000)),
-    "name": "Badge " + str(random.randint(1, 1000)),
-    "description": "Description of Badge " + str(random.randint(1, 1000)),
-    "unit": "Unit " + str(random.randint(1, 1000)),
-    "more_is_better": random.choice([True, False]),
-    "time_unit": "Time Unit " + str(random.randint(1, 1000)),
-    "badge_threshold": random.uniform(0, 3),
+    "handle": f"badge-{rand_suffix()}",
+    "name": f"Badge {rand_suffix()}",
+    "description": f"Description of Badge {rand_suffix()}",
+    "unit": f"Unit {rand_suffix()}",
+    "more_is_better": rand.choice([True, False]),
+    "time_unit": f"Time Unit {rand_suffix()}",
+    "badge_threshold": rand.uniform(0, 3),
     "zero_threshold":  0,
-    "confidence": random.uniform(0, 1)
+    "confidence": rand.uniform(0, 1)
   }
 
 typenames = {
     "Project": rand_project,
     "Assessment": rand_assessment,
     "LatentVariable": rand_latent_variable,
-    "LatentTimestampValueReal": rand_timestampvalue_real,
-    "LatentTimestampValueCategorical": rand_timestampvalue_categorical,
-    "ObservableTimestampValueReal": rand_timestampvalue_real,
-    "ObservableTimestampValueCategorical": rand_timestampvalue_categorical,
     "Indicator": rand_indicator,
     "Observable": rand_observable,
-    "Evidence": rand_evidence,
     "User": rand_user,
     "Method": rand_method,
     "Badge": rand_badge,
   }
 
-def create(typename, *args, key_response=False):
+# The typenames which are only generated in bulk, as pre-rendered data (see
+# timeseries_builders and rand_evidences).
+bulk_typenames = [
+    "Evidence",
+    "LatentTimestampValueReal",
+    "LatentTimestampValueCategorical",
+    "ObservableTimestampValueReal",
+    "ObservableTimestampValueCategorical",
+  ]
+
+# The create mutation field of each typename, built once so that creating an
+# entry only has to substitute its (escaped) data.
+create_templates = {
+  typename: f'create_{typename}(data: "%s") {{ _key }}'
+  for typename in [*typenames, *bulk_typenames, "SchemaVersion"]
+}
+
+async def arequest(request):
   """
-  Create a random defradb entry for this typename
-  typename: the typename to create (e.g. Project)
-  keys: the key arguments to each of those generation functions
+  Execute a graphql request against the defradb node without blocking the event loop
+  request: the graphql request string
   """
-  request = defradb.dict_to_create_query(typename, typenames[typename](*args))
-  response = client.request(request)
+  async with session.post(graphql_url, data=orjson.dumps({"query": request}), headers=json_headers) as response:
+    return response_data(await response.read())
 
-  if not key_response:
-    # get the key of the new entry and return it
-    return response[0]["_key"]
-  else:
-    return response[0]["_key"], response[0]
-
-if True:
-  client.load_schema(schema)
+def render_data(data):
+  """
+  Render an entry as the data argument of its create mutation: its JSON,
+  escaped to be embedded in a graphql string
+  """
+  return orjson.dumps(data).decode().replace('"', '\\"')
 
-def rand_timeseries(key, domain, kind):
+def create_renderer(typename):
   """
-  Build a categorical and a real timeseries for the given key
-  key: the key
-  kind: one of Observable or LatentVariable
+  Specialise the create mutation field of this typename: the returned renderer
+  takes an entry (or its pre-rendered (escaped) JSON) and an optional alias, the
+  latter being required when batching, and renders them into the prebuilt field
   """
-  match kind:
-    case "Observable":
-      if domain == "Real":
-        timestampvaluereal_key, timestampreal = create("ObservableTimestampValueReal", key, key_response=True)
-      elif domain == "Categorical":
-        timestampvalueobs_key, timestampobs = create("ObservableTimestampValueCategorical", key, key_response=True)
-    case "LatentVariable":
-      if domain == "Real":  
-        timestampvaluereal_key, timestampreal = create("LatentTimestampValueReal", key, key_response=True)
-      elif domain == "Categorical":
-        timestampvalueobs_key, timestampobs = create("LatentTimestampValueCategorical", key, key_response=True)
+  template = create_templates[typename]
+  aliased_template = "%s: " + template
 
+  def render(data, alias=None):
+    if not isinstance(data, str):
+      data = render_data(data)
+    return aliased_template % (alias, data) if alias else template % data
 
-projk = create("Project")
-for _ in range(2):
-  assessment_key = create("Assessment", projk)
+  return render
 
-  for _ in range(2):
-    # variable_domain = random.choice(["Real", "Categorical"])
-    variable_domain = random.choice(["Real"])
-    variable_key = create("LatentVariable", assessment_key, variable_domain)
+# The create mutation field renderer of each typename.
+create_renderers = {typename: create_renderer(typename) for typename in create_templates}
 
-    create("Badge", variable_key)
+async def create(typename, *args):
+  """
+  Create a random defradb entry for this typename
+  typename: the typename to create (e.g. Project)
+  keys: the key arguments to each of those generation functions
+  """
+  key, = await create_many(typename, [args])
+  return key
 
-    # build the timeseries for the latent variable
-    for _ in range(3):
-      rand_timeseries(variable_key, variable_domain, "LatentVariable")
+async def insert_together(groups):
+  """
+  Create the entries of several typenames in a single request, and so within a
+  single defradb transaction: either all of them are committed, or none are
+  groups: (typename, entries) pairs of the entries to create
+  returns: the keys of the created entries, grouped like the groups
+  """
+  mutations = []
+  for typename, entries in groups:
+    render = create_renderers[typename]
+    for entry in entries:
+      mutations.append(render(entry, f"a{len(mutations)}"))
+  if not mutations:
+    return [[] for _ in groups]
+
+  response = await arequest("mutation { " + " ".join(mutations) + " }")
+
+  # the entries are returned in the order of their aliases
+  keys, start = [], 0
+  for _, entries in groups:
+    keys.append([entry["_key"] for entry in response[start:start + len(entries)]])
+    start += len(entries)
+  return keys
+
+async def insert_many(typename, entries):
+  """
+  Create the given defradb entries of this typename in a single request
+  typename: the typename to create (e.g. LatentTimestampValueReal)
+  entries: the entries to create
+  """
+  keys, = await insert_together([(typename, entries)])
+  return keys
 
-    # create the indicators
-    for _ in range(3):
-      # observable_domain = random.choice(["Real", "Categorical"])
-      observable_domain = random.choice(["Real"])
+async def create_many(typename, args_list):
+  """
+  Create several random defradb entries for this typename in a single request
+  typename: the typename to create (e.g. LatentTimestampValueReal)
+  args_list: the key arguments to the generation function, one tuple per entry
+  """
+  generate = typenames[typename]
+  return await insert_many(typename, [generate(*args) for args in args_list])
 
-      # one observable for each indicator
-      observable_key, observable = create("Observable", assessment_key, observable_domain, key_response=True)
+class CreateLoader:
+  """
+  Coalesce the creation of defradb entries of a typename by name: entries
+  sharing a name are only created once, and the entries requested within a
+  short window are created together in a single batched request
+  typename: the typename to create (e.g. User)
+  max_batch_size: the number of pending entries which triggers an immediate flush
+  delay: the number of seconds to wait for more entries before flushing
+  """
+  def __init__(self, typename, max_batch_size=16, delay=0.001):
+    self.typename = typename
+    self.max_batch_size = max_batch_size
+    self.delay = delay
+    self._keys = {}
+    self._queue = []
+    self._flush_handle = None
+    self._tasks = set()
+
+  def load(self, entry):
+    """
+    Get a future of the key of the entry named like this one, creating the entry
+    if no entry of that name was created yet
+    entry: the entry to create
+    """
+    future = self._keys.get(entry["name"])
+    if future is not None:
+      return future
+
+    loop = asyncio.get_running_loop()
+    future = self._keys[entry["name"]] = loop.create_future()
+    self._queue.append((entry, future))
+
+    if len(self._queue) >= self.max_batch_size:
+      self._flush()
+    elif self._flush_handle is None:
+      self._flush_handle = loop.call_later(self.delay, self._flush)
+    return future
+
+  def _flush(self):
+    if self._flush_handle is not None:
+      self._flush_handle.cancel()
+      self._flush_handle = None
+
+    batch, self._queue = self._queue, []
+    task = asyncio.get_running_loop().create_task(self._create(batch))
+    self._tasks.add(task)
+    task.add_done_callback(self._tasks.discard)
+
+  async def _create(self, batch):
+    try:
+      keys = await insert_many(self.typename, [entry for entry, _ in batch])
+    except Exception as e:
+      # forget the failed names, so that loading them again retries their creation
+      for entry, future in batch:
+        self._keys.pop(entry["name"], None)
+        future.set_exception(e)
+    else:
+      for (_, future), key in zip(batch, keys):
+        future.set_result(key)
+
+# Users are shared between the evidences they uploaded within a project (the
+# loader is bound to the event loop seeding it, see seed). Methods are not
+# coalesced, since each of them belongs to a single observable.
+users = None
+
+def load_schema():
+  """
+  Load the schema into the defradb node, unless the node already holds this
+  version of it (as recorded by its sha256 in a SchemaVersion entry)
+  """
+  schema_hash = hashlib.sha256(schema.encode()).hexdigest()
+  try:
+    versions = client.request(f'{{ SchemaVersion(filter: {{hash: {{_eq: "{schema_hash}"}}}}) {{ _key }} }}')
+  except RequestError as e:
+    if not e.is_unknown_field("SchemaVersion"):
+      raise
+    # the node doesn't record schema versions yet, though it may already hold
+    # the types of the schema, so load the SchemaVersion type on its own
+    client.load_schema(schema_version_schema)
+    versions = []
+
+  if versions:
+    return
+
+  # the node rejects the whole schema if any of its types already exist (which
+  # defradb.DefraClient only logs). It can't reload them anyway, so the version
+  # is recorded then too, sparing the next runs from submitting them again.
+  response = client.load_schema(schema)
+  errors = response.get("errors", [])
+  if all("schema type already exists" in error["message"] for error in errors):
+    client.request("mutation { " + create_renderers["SchemaVersion"]({"hash": schema_hash}) + " }")
+
+# The timeseries typename and bulk generation function of each (kind, domain).
+timeseries_builders = {
+  ("Observable", "Real"): ("ObservableTimestampValueReal", rand_timestampvalues_real),
+  ("Observable", "Categorical"): ("ObservableTimestampValueCategorical", rand_timestampvalues_categorical),
+  ("LatentVariable", "Real"): ("LatentTimestampValueReal", rand_timestampvalues_real),
+  ("LatentVariable", "Categorical"): ("LatentTimestampValueCategorical", rand_timestampvalues_categorical),
+}
 
-      indicator_key = create("Indicator", variable_key, observable_key)
+def rand_timeseries(key, domain, kind, n=3):
+  """
+  Build a timeseries of n points for the given key
+  key: the key
+  domain: one of Real or Categorical
+  kind: one of Observable or LatentVariable
+  returns: the typename and the entries of the timeseries points
+  """
+  typename, generate = timeseries_builders[kind, domain]
+  return typename, generate(key, n)
 
-      # build the timeseries for the observable
-      for _ in range(3):
-        rand_timeseries(observable_key, observable_domain, "Observable")
+async def seed_evidences(observable_keys):
+  """
+  Create between one and three evidences, each uploaded by a (shared) user, on each observable
+  """
+  evidence_observable_keys = np.repeat(observable_keys, rng.integers(1, 3, len(observable_keys), endpoint=True)).tolist()
+  user_keys = await asyncio.gather(*[users.load(rand_user()) for _ in evidence_observable_keys])
+  await insert_many("Evidence", rand_evidences(evidence_observable_keys, user_keys))
 
-      create("Method", observable_key)
-    
-      # create evidences on the observable
-      for _ in range(random.randint(1,3)):
-        user_key = create("User")
-        evidence_key = create("Evidence", observable_key, user_key)
+async def seed_levels(project_key):
+  """
+  Create the two assessments of the project, with two latent variables each,
+  along with their badges, timeseries, and three observables indicating each
+  variable. The tree is created level by level, each level in a single request,
+  so that the number of requests doesn't grow with the size of the tree.
+  """
+  assessment_keys = await create_many("Assessment", [(project_key, date) for date in random_datetimes(2)])
+
+  # variable_domains = rand.choices(["Real", "Categorical"], k=2)
+  variables = [
+    (assessment_key, domain) for assessment_key in assessment_keys for domain in rand.choices(["Real"], k=2)
+  ]
+  variable_keys = await create_many("LatentVariable", variables)
+
+  # one observable for each indicator
+  # observable_domains = rand.choices(["Real", "Categorical"], k=3)
+  observables = [
+    (assessment_key, variable_key, domain)
+    for (assessment_key, _), variable_key in zip(variables, variable_keys)
+    for domain in rand.choices(["Real"], k=3)
+  ]
+
+  *_, observable_keys = await insert_together([
+    ("Badge", [rand_badge(variable_key) for variable_key in variable_keys]),
+    # build the timeseries for the latent variables
+    *[rand_timeseries(key, domain, "LatentVariable") for key, (_, domain) in zip(variable_keys, variables)],
+    ("Observable", [rand_observable(assessment_key, domain) for assessment_key, _, domain in observables]),
+  ])
+
+  # create the indicators, and the timeseries and method of each observable
+  groups = [
+    ("Indicator", [rand_indicator(variable_key, key) for (_, variable_key, _), key in zip(observables, observable_keys)]),
+    *[rand_timeseries(key, domain, "Observable") for key, (_, _, domain) in zip(observable_keys, observables)],
+    ("Method", [rand_method(key) for key in observable_keys]),
+  ]
+
+  # the users of the evidences are shared across the tree, so they are created apart
+  await asyncio.gather(insert_together(groups), seed_evidences(observable_keys))
+
+async def seed():
+  """
+  Seed the defradb node with a random project and its assessments
+  """
+  global session, users
+  users = CreateLoader("User")
+  connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+  headers = {"Connection": "keep-alive"}
+  async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+    projk = await create("Project")
+    await seed_levels(projk)
+
+def init_worker():
+  """
+  Reseed the random generators of a worker process from fresh OS entropy, so
+  that workers forked from the same parent don't generate the same data
+  """
+  global rng
+  rand.seed()
+  rng = np.random.default_rng()
 
+def seed_project(_):
+  """
+  Seed a random project in its own event loop and http session, so that
+  projects can be seeded from independent worker processes
+  """
+  asyncio.run(seed())
+
+# The number of projects to seed, and of worker processes seeding them.
+n_projects = 1
+n_workers = 8
+
+def main():
+  """
+  Load the schema, then seed the defradb node with n_projects random projects
+  """
+  global client
+  client = SessionDefraClient(config)
+  try:
+    load_schema()
+  finally:
+    # the workers only seed through their own aiohttp sessions
+    client.close()
+    client = None
+
+  max_workers = min(n_workers, n_projects)
+  if max_workers <= 1:
+    # no parallelism to gain from a pool, seed in this process
+    for i in range(n_projects):
+      seed_project(i)
+    return
+
+  with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker) as executor:
+    list(executor.map(seed_project, range(n_projects)))
+
+if __name__ == "__main__":
+  main()
@@ -53,6 +53,45 @@ func TestMutationCreateSimpleErrorsGivenNonExistantField(t *testing.T) {
 	testUtils.ExecuteTestCase(t, []string{"Users"}, test)
 }
 
+func TestMutationCreateSimpleWithMultipleAliasedCreatesErrorsGivenNonExistantField(t *testing.T) {
+	test := testUtils.TestCase{
+		Description: "Simple create mutation with multiple aliased creates, one with a non existant field",
+		Actions: []any{
+			testUtils.SchemaUpdate{
+				Schema: `
+					type Users {
+						name: String
+					}
+				`,
+			},
+			testUtils.Request{
+				Request: `mutation {
+							a0: create_Users(data: "{\"name\": \"John\"}") {
+								_key
+							}
+							a1: create_Users(data: "{\"name\": \"Bob\",\"fieldDoesNotExist\": 27}") {
+								_key
+							}
+						}`,
+				ExpectedError: "The given field does not exist. Name: fieldDoesNotExist",
+			},
+			testUtils.Request{
+				// Ensure that the valid create has not been committed either.
+				Request: `
+					query {
+						Users {
+							name
+						}
+					}
+				`,
+				Results: []map[string]any{},
+			},
+		},
+	}
+
+	testUtils.ExecuteTestCase(t, []string{"Users"}, test)
+}
+
 func TestMutationCreateSimple(t *testing.T) {
 	test := testUtils.RequestTestCase{
 		Description: "Simple create mutation",
@@ -122,3 +161,31 @@ func TestMutationCreateSimpleDoesNotCreateDocEmptyData(t *testing.T) {
 
 	simpleTests.ExecuteTestCase(t, test)
 }
+
+func TestMutationCreateSimpleWithMultipleAliasedCreates(t *testing.T) {
+	test := testUtils.RequestTestCase{
+		Description: "Simple create mutation with multiple aliased creates",
+		Request: `mutation {
+					a0: create_User(data: "{\"name\": \"John\",\"age\": 27}") {
+						name
+						age
+					}
+					a1: create_User(data: "{\"name\": \"Bob\",\"age\": 31}") {
+						name
+						age
+					}
+				}`,
+		Results: []map[string]any{
+			{
+				"name": "John",
+				"age":  uint64(27),
+			},
+			{
+				"name": "Bob",
+				"age":  uint64(31),
+			},
+		},
+	}
+
+	simpleTests.ExecuteTestCase(t, test)
+}